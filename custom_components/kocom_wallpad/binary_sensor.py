@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorDeviceClass,
@@ -36,13 +38,17 @@ async def async_setup_entry(
     gateway: KocomGateway = hass.data[DOMAIN][entry.entry_id]
     
     @callback
-    def async_add_binary_sensor(packet: KocomPacket) -> None:
-        """Add new binary sensor entity."""
-        if isinstance(packet, (ThermostatPacket, FanPacket, MotionPacket)):
-            async_add_entities([KocomBinarySensorEntity(gateway, packet)])
+    def async_add_binary_sensor(packets: Iterable[KocomPacket]) -> None:
+        """Add new binary sensor entities."""
+        async_add_entities(
+            [
+                KocomBinarySensorEntity(gateway, packet)
+                for packet in packets
+                if isinstance(packet, (ThermostatPacket, FanPacket, MotionPacket))
+            ]
+        )
     
-    for entity in gateway.get_entities(Platform.BINARY_SENSOR):
-        async_add_binary_sensor(entity)
+    async_add_binary_sensor(gateway.get_entities(Platform.BINARY_SENSOR))
         
     entry.async_on_unload(
         async_dispatcher_connect(hass, f"{DOMAIN}_binary_sensor_add", async_add_binary_sensor)
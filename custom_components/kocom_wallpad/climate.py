@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from homeassistant.components.climate import ClimateEntity
 from homeassistant.components.climate.const import (
     ClimateEntityFeature,
@@ -44,15 +46,17 @@ async def async_setup_entry(
     gateway: KocomGateway = hass.data[DOMAIN][entry.entry_id]
     
     @callback
-    def async_add_climate(packet: KocomPacket) -> None:
-        """Add new climate entity."""
-        if isinstance(packet, ThermostatPacket):
-            async_add_entities([KocomThermostatEntity(gateway, packet)])
-        elif isinstance(packet, ACPacket):
-            async_add_entities([KocomACEntity(gateway, packet)])
+    def async_add_climate(packets: Iterable[KocomPacket]) -> None:
+        """Add new climate entities."""
+        entities: list[ClimateEntity] = []
+        for packet in packets:
+            if isinstance(packet, ThermostatPacket):
+                entities.append(KocomThermostatEntity(gateway, packet))
+            elif isinstance(packet, ACPacket):
+                entities.append(KocomACEntity(gateway, packet))
+        async_add_entities(entities)
     
-    for entity in gateway.get_entities(Platform.CLIMATE):
-        async_add_climate(entity)
+    async_add_climate(gateway.get_entities(Platform.CLIMATE))
         
     entry.async_on_unload(
         async_dispatcher_connect(hass, f"{DOMAIN}_climate_add", async_add_climate)
@@ -3,10 +3,17 @@
 from __future__ import annotations
 
 from typing import Optional
-import time
 import asyncio
+import random
+import socket
 
-from .const import LOGGER
+from .const import LOGGER, RECONNECT_BACKOFF
+
+
+def _set_result_unless_done(fut: asyncio.Future) -> None:
+    """Resolve a send-gate future unless it was already cancelled."""
+    if not fut.done():
+        fut.set_result(None)
 
 
 class Connection:
@@ -20,135 +27,179 @@ class Connection:
         self.reader: Optional[asyncio.StreamReader] = None
         self.writer: Optional[asyncio.StreamWriter] = None
         self.reconnect_attempts: int = 0
+        # 재연결 시각은 loop.time() 기준 (단조 증가, 시스템 시계 변경 영향 없음)
         self.last_reconnect_attempt: Optional[float] = None
         self.next_attempt_time: Optional[float] = None
         
         # ?? 개선: 추가 상태 관리
         self.max_reconnect_attempts: int = 10  # 최대 재연결 시도
-        self.last_send_time: float = 0  # 마지막 패킷 전송 시간
         self.packet_interval: float = 0.8  # 코콤 권장 간격
-        self._connection_lock = asyncio.Lock()  # 동시 연결 방지
+        self._loop = asyncio.get_running_loop()
+        self._next_send_ts: float = 0.0  # 다음 패킷 전송 가능 시각 (loop.time 기준)
+        self._connecting: bool = False  # 동시 연결 방지
+        self._reconnecting: bool = False  # 동시 재연결 방지
+        self._connected_event = asyncio.Event()  # 연결 수립 알림
 
     async def connect(self) -> bool:
         """Establish a connection."""
-        async with self._connection_lock:
-            try:
-                # ?? 개선: 타임아웃 설정
-                self.reader, self.writer = await asyncio.wait_for(
-                    asyncio.open_connection(self.host, self.port),
-                    timeout=10.0
-                )
-                self.reconnect_attempts = 0
-                self.next_attempt_time = None
-                LOGGER.info(f"Connection established to {self.host}:{self.port}")
-                return True
-                
-            except asyncio.TimeoutError:
-                LOGGER.error(f"Connection timeout to {self.host}:{self.port}")
-                return False
-            except Exception as e:
-                LOGGER.error(f"Connection failed: {e}")
-                return False
+        if self._connecting:
+            LOGGER.debug("Connection attempt already in progress")
+            return False
 
-    def is_connected(self) -> bool:
-        """Check if the connection is active."""
-        if self.writer is None:
+        self._connecting = True
+        try:
+            # ?? 개선: 타임아웃 설정
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port),
+                timeout=10.0
+            )
+            self.reconnect_attempts = 0
+            self.next_attempt_time = None
+            self._connected_event.set()
+            LOGGER.info("Connection established to %s:%s", self.host, self.port)
+            return True
+            
+        except asyncio.TimeoutError:
+            LOGGER.error("Connection timeout to %s:%s", self.host, self.port)
             return False
-        
-        # ?? 개선: 실제 연결 상태 확인
-        if self.writer.is_closing():
+        except Exception as e:
+            LOGGER.error("Connection failed: %s", e)
             return False
-            
-        # 추가 검증: 소켓 상태 확인
-        try:
-            transport = self.writer.get_extra_info('socket')
-            if transport is None:
-                return False
+        finally:
+            self._connecting = False
+
+    @property
+    def connected(self) -> bool:
+        """Return True if the connection is active."""
+        w = self.writer
+        return w is not None and not w.is_closing()
+
+    async def wait_connected(self, timeout: float) -> bool:
+        """Wait until the connection is established or the timeout elapses."""
+        if self.connected:
             return True
-        except Exception:
+
+        # 상대측 종료로 끊긴 경우 이벤트가 남아 있을 수 있으므로 초기화
+        self._connected_event.clear()
+        try:
+            async with asyncio.timeout(timeout):
+                await self._connected_event.wait()
+        except TimeoutError:
             return False
+        return self.connected
 
     async def reconnect(self) -> bool:
         """Attempt to reconnect with exponential backoff."""
+        if self._reconnecting:
+            LOGGER.debug("Reconnection already in progress")
+            return False
+
+        self._reconnecting = True
+        try:
+            return await self._reconnect()
+        finally:
+            self._reconnecting = False
+
+    async def _reconnect(self) -> bool:
+        """Run a single reconnection attempt."""
         # ?? 개선: 최대 시도 횟수 제한
         if self.reconnect_attempts >= self.max_reconnect_attempts:
-            LOGGER.error(f"Max reconnection attempts ({self.max_reconnect_attempts}) reached. Giving up.")
+            LOGGER.error("Max reconnection attempts (%s) reached. Giving up.", self.max_reconnect_attempts)
             return False
 
         # 기존 연결 정리
         await self._close_connection()
 
-        current_time = time.time()
+        current_time = self._loop.time()
         
         # 재연결 간격 제어
         if self.next_attempt_time and current_time < self.next_attempt_time:
             wait_time = self.next_attempt_time - current_time
-            LOGGER.info(f"Waiting {wait_time:.1f} seconds before next reconnection attempt.")
+            LOGGER.info("Waiting %.1f seconds before next reconnection attempt.", wait_time)
             await asyncio.sleep(wait_time)
         
         self.reconnect_attempts += 1
-        delay = min(2 ** self.reconnect_attempts, 60)
+        delay = RECONNECT_BACKOFF[min(self.reconnect_attempts - 1, len(RECONNECT_BACKOFF) - 1)]
+        delay *= random.uniform(0.8, 1.2)  # 여러 엔트리의 동시 재연결 방지
         self.last_reconnect_attempt = current_time
         self.next_attempt_time = current_time + delay
         
-        LOGGER.info(f"Reconnection attempt {self.reconnect_attempts}/{self.max_reconnect_attempts}")
+        LOGGER.info("Reconnection attempt %s/%s", self.reconnect_attempts, self.max_reconnect_attempts)
         
         # ?? 개선: 무한루프 방지 - connect() 직접 호출
         success = await self.connect()
         
         if success:
-            LOGGER.info(f"Successfully reconnected on attempt {self.reconnect_attempts}")
+            LOGGER.info("Successfully reconnected on attempt %s", self.reconnect_attempts)
             self.reconnect_attempts = 0
             self.next_attempt_time = None
             return True
         else:
-            LOGGER.warning(f"Reconnection attempt {self.reconnect_attempts} failed")
+            LOGGER.warning("Reconnection attempt %s failed", self.reconnect_attempts)
             return False
 
+    async def _wait_send_slot(self) -> None:
+        """Wait until the packet interval since the last write has elapsed."""
+        delay = max(0.0, self._next_send_ts - self._loop.time())
+        if delay > 0:
+            fut = self._loop.create_future()
+            handle = self._loop.call_later(delay, _set_result_unless_done, fut)
+            try:
+                await fut
+            finally:
+                handle.cancel()
+
     async def send(self, packet: bytearray) -> bool:
         """Send a packet with proper interval control."""
-        if not self.is_connected():
+        return await self.send_many([packet]) == 1
+
+    async def send_many(self, packets: list[bytearray]) -> int:
+        """Send packets with proper interval control and a single drain.
+
+        Returns how many packets were confirmed sent by the drain: all of them
+        on success, 0 if any write or the drain failed (frames carry full
+        state, so resending them is safe).
+        """
+        if self.writer is None or self.writer.is_closing():
             LOGGER.warning("Cannot send packet: not connected")
-            return False
+            return 0
 
         try:
-            # ?? 개선: 패킷 전송 간격 준수
-            current_time = time.time()
-            elapsed = current_time - self.last_send_time
-            
-            if elapsed < self.packet_interval:
-                wait_time = self.packet_interval - elapsed
-                await asyncio.sleep(wait_time)
+            if self.packet_interval <= 0:
+                # 전송 간격이 필요 없으면 한 번의 write로 합쳐 전송
+                self.writer.writelines(packets)
+            else:
+                # ?? 개선: 패킷 전송 간격 준수
+                for packet in packets:
+                    await self._wait_send_slot()
+                    self.writer.write(packet)
+                    self._next_send_ts = self._loop.time() + self.packet_interval
             
-            self.writer.write(packet)
+            # 끊긴 링크에서는 write()가 조용히 버리고 drain()만 실패하므로 drain 이후에만 전송 완료로 집계
             await self.writer.drain()
-            
-            self.last_send_time = time.time()
-            return True
+            return len(packets)
             
         except Exception as e:
-            LOGGER.error(f"Failed to send packet: {e}")
+            LOGGER.error("Failed to send packet: %s", e)
             # ?? 개선: 즉시 재연결하지 않고 상태만 확인
-            if not self.is_connected():
+            if not self.connected:
                 LOGGER.info("Connection lost, will attempt reconnection on next operation")
-            return False
+            return 0
 
     async def receive(self, read_byte: int = 2048, timeout: float = 2.0) -> Optional[bytes]:
         """Receive data with timeout."""
-        if not self.is_connected():
+        if not self.connected:
             return None
             
         try:
             # ?? 개선: 타임아웃 설정 추가
-            return await asyncio.wait_for(
-                self.reader.read(read_byte), 
-                timeout=timeout
-            )
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(timeout):
+                return await self.reader.read(read_byte)
+        except TimeoutError:
             LOGGER.debug("Receive timeout - no data available")
             return None
         except Exception as e:
-            LOGGER.error(f"Failed to receive data: {e}")
+            LOGGER.error("Failed to receive data: %s", e)
             return None
 
     async def _close_connection(self) -> None:
@@ -158,10 +209,11 @@ class Connection:
                 self.writer.close()
                 await self.writer.wait_closed()
             except Exception as e:
-                LOGGER.debug(f"Error during connection close: {e}")
+                LOGGER.debug("Error during connection close: %s", e)
             finally:
                 self.writer = None
                 self.reader = None
+                self._connected_event.clear()
     
     async def close(self) -> None:
         """Close the connection."""
@@ -177,34 +229,34 @@ class Connection:
     # ?? 개선: 연결 통계 메서드 추가
     def get_connection_stats(self) -> dict:
         """Get connection statistics."""
+        # 시각 값은 모두 loop.time() 기준의 단조 시계 값
         return {
-            "connected": self.is_connected(),
+            "connected": self.connected,
             "reconnect_attempts": self.reconnect_attempts,
             "max_attempts": self.max_reconnect_attempts,
-            "last_send_time": self.last_send_time,
+            "last_reconnect_attempt": self.last_reconnect_attempt,
+            "next_attempt_time": self.next_attempt_time,
+            "next_send_time": self._next_send_ts,
             "packet_interval": self.packet_interval
         }
 
 
 async def test_connection(host: str, port: int, timeout: int = 5) -> bool:
     """Test the connection with a timeout."""
-    connection = Connection(host, port)
+    loop = asyncio.get_running_loop()
     try:
-        # ?? 개선: 연결 결과 확인
-        success = await asyncio.wait_for(connection.connect(), timeout=timeout)
-        
-        if success and connection.is_connected():
-            LOGGER.info("Connection test successful")
-            return True
-        else:
-            LOGGER.error("Connection test failed")
-            return False
+        # ?? 개선: 스트림 객체 생성 없이 소켓 연결만 확인
+        async with asyncio.timeout(timeout):
+            sock = await loop.run_in_executor(
+                None, socket.create_connection, (host, port), timeout
+            )
+        sock.close()
+        LOGGER.info("Connection test successful")
+        return True
             
-    except asyncio.TimeoutError:
+    except TimeoutError:
         LOGGER.error("Connection test timed out")
         return False
-    except Exception as e:
-        LOGGER.error(f"Connection test failed: {e}")
+    except OSError as e:
+        LOGGER.error("Connection test failed: %s", e)
         return False
-    finally:
-        await connection.close()
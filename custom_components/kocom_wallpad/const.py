@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 # ?? ����: Ÿ�� üũ �ÿ��� import
@@ -25,6 +27,8 @@ import logging
 
 # Domain and logging
 DOMAIN = "kocom_wallpad"
+# 통합구성요소 전체가 하나의 로거를 공유 (custom_components.kocom_wallpad).
+# 로그 메시지는 f-string 대신 "%s" 지연 포맷을 사용해야 비활성 레벨에서 포맷 비용이 들지 않음.
 LOGGER = logging.getLogger(__package__)
 
 # Default configuration
@@ -47,7 +51,7 @@ PACKET_DATA = "packet_data"
 LAST_DATA = "last_data"
 
 # ?? ����: �ùٸ� Ÿ�� ��Ʈ�� ����
-PLATFORM_MAPPING: dict[type, Platform] = {
+PLATFORM_MAPPING: Mapping[type, Platform] = MappingProxyType({
     LightPacket: Platform.LIGHT,
     OutletPacket: Platform.SWITCH,
     ThermostatPacket: Platform.CLIMATE,
@@ -57,10 +61,10 @@ PLATFORM_MAPPING: dict[type, Platform] = {
     GasPacket: Platform.SWITCH,
     MotionPacket: Platform.BINARY_SENSOR,
     EVPacket: Platform.SWITCH,
-}
+})
 
 # ?? ����: �߰� �����
-SUPPORTED_PLATFORMS = list(PLATFORM_MAPPING.values())
+SUPPORTED_PLATFORMS: tuple[Platform, ...] = tuple(dict.fromkeys(PLATFORM_MAPPING.values()))
 
 # Brightness constants
 MIN_BRIGHTNESS = 1
@@ -71,6 +75,7 @@ DEFAULT_BRIGHTNESS = 255
 MAX_RETRIES = 5
 RETRY_DELAY = 0.25
 PACKET_TIMEOUT = 2.0
+RECONNECT_BACKOFF: tuple[int, ...] = tuple(min(2 ** i, 60) for i in range(1, 11))
 
 # ?? ����: ���� �Լ���
 def validate_platform_mapping() -> bool:
@@ -78,11 +83,11 @@ def validate_platform_mapping() -> bool:
     try:
         for packet_type, platform in PLATFORM_MAPPING.items():
             if not isinstance(platform, Platform):
-                LOGGER.error(f"Invalid platform type for {packet_type}: {platform}")
+                LOGGER.error("Invalid platform type for %s: %s", packet_type, platform)
                 return False
         return True
     except Exception as e:
-        LOGGER.error(f"Platform mapping validation failed: {e}")
+        LOGGER.error("Platform mapping validation failed: %s", e)
         return False
 
 def get_platform_for_packet(packet_type: type) -> Platform | None:
@@ -41,6 +41,7 @@ class KocomEntity(RestoreEntity):
         self.gateway = gateway
         self.packet = packet
         self.packet_update_signal = f"{DOMAIN}_{self.gateway.host}_{self.device_id}"
+        self._optimistic = False  # 전송한 명령을 장치 응답 전에 미리 표시 중
         
         self._attr_unique_id = f"{BRAND_NAME}_{self.device_id}-{self.gateway.host}"
         self._attr_name = f"{BRAND_NAME} {self.device_name}"
@@ -79,15 +80,30 @@ class KocomEntity(RestoreEntity):
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self.gateway.connection.is_connected()
+        return self.gateway.connection.connected
     
     @callback
     def async_handle_packet_update(self, packet: KocomPacket) -> None:
         """Handle packet update."""
-        if self.packet.packet != packet.packet:
+        # 낙관적 상태 표시 중이면 동일 패킷이라도 다시 반영해 원복
+        if (
+            self._optimistic
+            or self.packet.packet != packet.packet
+            or self.packet._device.state != packet._device.state
+        ):
+            self._optimistic = False
             self.packet = packet
+            self._handle_packet_update()
             self.async_write_ha_state()
 
+    def _handle_packet_update(self) -> None:
+        """Refresh state derived from the packet before it is written."""
+
+    def _mark_optimistic(self) -> None:
+        """Have the next device frame replace the optimistic state, even if unchanged."""
+        self._optimistic = True
+        self.gateway.mark_unconfirmed(self.device_id)
+
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
@@ -108,6 +124,7 @@ class KocomEntity(RestoreEntity):
         }
         return RestoredExtraData(extra_data)
     
-    async def send_packet(self, packet: bytes) -> None:
+    async def send_packet(self, packet: bytes) -> bool:
         """Send a packet to the gateway."""
-        await self.gateway.client.send_packet(packet)
+        # 전송 순서는 클라이언트 큐의 단일 소비자가 보장하므로 엔티티 단 잠금은 두지 않음
+        return await self.gateway.client.send_packet(packet)
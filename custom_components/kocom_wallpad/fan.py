@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any, Optional
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
@@ -34,13 +35,17 @@ async def async_setup_entry(
     gateway: KocomGateway = hass.data[DOMAIN][entry.entry_id]
     
     @callback
-    def async_add_fan(packet: KocomPacket) -> None:
-        """Add new fan entity."""
-        if isinstance(packet, FanPacket):
-            async_add_entities([KocomFanEntity(gateway, packet)])
+    def async_add_fan(packets: Iterable[KocomPacket]) -> None:
+        """Add new fan entities."""
+        async_add_entities(
+            [
+                KocomFanEntity(gateway, packet)
+                for packet in packets
+                if isinstance(packet, FanPacket)
+            ]
+        )
     
-    for entity in gateway.get_entities(Platform.FAN):
-        async_add_fan(entity)
+    async_add_fan(gateway.get_entities(Platform.FAN))
         
     entry.async_on_unload(
         async_dispatcher_connect(hass, f"{DOMAIN}_fan_add", async_add_fan)
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-import asyncio
-from typing import Optional
+from collections.abc import ValuesView
+from typing import Callable, Optional
 
 from homeassistant.const import Platform, CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant, Event
@@ -28,6 +28,49 @@ from .util import create_dev_id, decode_base64_to_bytes
 from .const import LOGGER, DOMAIN, PACKET_DATA, LAST_DATA, PLATFORM_MAPPING
 
 
+PlatformResolver = Callable[[KocomPacket], Platform | None]
+
+
+def _fixed_platform(platform: Platform) -> PlatformResolver:
+    """Return a resolver that always maps to the given platform."""
+    def resolve(packet: KocomPacket) -> Platform:
+        return platform
+    return resolve
+
+
+# sub_id의 마지막 토큰 기준 (예: "boiler error" -> "error", "hotwater temperature" -> "temperature")
+_SUB_ID_TO_PLATFORM: dict[str, Platform] = {
+    ERROR: Platform.BINARY_SENSOR,
+    CO2: Platform.SENSOR,
+    TEMPERATURE: Platform.SENSOR,
+    DIRECTION: Platform.SENSOR,  # EV
+    FLOOR: Platform.SENSOR,  # EV
+}
+
+
+def _sub_id_platform(platform: Platform) -> PlatformResolver:
+    """Return a resolver that maps sensor-like sub devices away from the base platform."""
+    def resolve(packet: KocomPacket) -> Platform:
+        sub_id = packet._device.sub_id if packet._device else None
+        if not sub_id:
+            return platform
+        return _SUB_ID_TO_PLATFORM.get(sub_id.rpartition(" ")[2], platform)
+    return resolve
+
+
+_SUB_ID_PACKET_TYPES = (ThermostatPacket, FanPacket, EVPacket)
+# 패킷 클래스의 _TYPE_ID로 인덱싱하는 리졸버 테이블
+_PLATFORM_RESOLVERS: list[PlatformResolver | None] = [None] * (
+    max(packet_type._TYPE_ID for packet_type in PLATFORM_MAPPING) + 1
+)
+for _packet_type, _platform in PLATFORM_MAPPING.items():
+    _PLATFORM_RESOLVERS[_packet_type._TYPE_ID] = (
+        _sub_id_platform(_platform)
+        if _packet_type in _SUB_ID_PACKET_TYPES
+        else _fixed_platform(_platform)
+    )
+
+
 class KocomGateway:
     """Represents a Kocom Wallpad gateway."""
 
@@ -49,13 +92,14 @@ class KocomGateway:
         # ??     :            ? 
         self._is_starting = False
         self._is_stopping = False
-        self._packet_lock = asyncio.Lock()  #   ? o      u      
-        self._entity_callbacks: set = set()  #  ?      
+        self._entity_callbacks: list[Callable[[], bool]] = []  # 콜백 해제 함수
+        self._signal_cache: dict[tuple[Platform, str], tuple[str, str]] = {}
+        self._unconfirmed: set[str] = set()  # 낙관적 상태를 표시 중인 장치 ID
     
     async def async_connect(self) -> bool:
         """Connect to the gateway."""
         try:
-            LOGGER.debug(f"Attempting to connect to {self.host}:{self.port}")
+            LOGGER.debug("Attempting to connect to %s:%s", self.host, self.port)
             
             # ??     : connection.connect()   ?   ?  
             connection_success = await self.connection.connect()
@@ -64,22 +108,22 @@ class KocomGateway:
                 return False
             
             # ??     :             ?  
-            if not self.connection.is_connected():
+            if not self.connection.connected:
                 LOGGER.error("Connection established but status check failed")
                 return False
             
             # ??     : ?   ? ?  ? ?
             try:
                 self.client = KocomClient(self.connection)
-                LOGGER.info(f"Successfully connected to {self.host}:{self.port}")
+                LOGGER.info("Successfully connected to %s:%s", self.host, self.port)
                 return True
             except Exception as e:
-                LOGGER.error(f"Failed to initialize client: {e}")
+                LOGGER.error("Failed to initialize client: %s", e)
                 await self.connection.close()
                 return False
                 
         except Exception as e:
-            LOGGER.error(f"Connection failed with exception: {e}")
+            LOGGER.error("Connection failed with exception: %s", e)
             return False
     
     async def async_disconnect(self) -> None:
@@ -93,6 +137,8 @@ class KocomGateway:
         try:
             # ??     :  u?           
             # 1.  ?      
+            for unsub in self._entity_callbacks:
+                unsub()
             self._entity_callbacks.clear()
             
             # 2. ?   ? ?     
@@ -101,26 +147,28 @@ class KocomGateway:
                     await self.client.stop()
                     LOGGER.debug("Client stopped successfully")
                 except Exception as e:
-                    LOGGER.warning(f"Error stopping client: {e}")
+                    LOGGER.warning("Error stopping client: %s", e)
                 finally:
                     self.client = None
             
             # 3.   ??     
             try:
                 self.entities.clear()
+                self._signal_cache.clear()
+                self._unconfirmed.clear()
                 LOGGER.debug("Entities cleared")
             except Exception as e:
-                LOGGER.warning(f"Error clearing entities: {e}")
+                LOGGER.warning("Error clearing entities: %s", e)
             
             # 4.          
             try:
                 await self.connection.close()
                 LOGGER.debug("Connection closed")
             except Exception as e:
-                LOGGER.warning(f"Error closing connection: {e}")
+                LOGGER.warning("Error closing connection: %s", e)
                 
         except Exception as e:
-            LOGGER.error(f"Error during disconnect: {e}")
+            LOGGER.error("Error during disconnect: %s", e)
         finally:
             self._is_stopping = False
 
@@ -137,77 +185,78 @@ class KocomGateway:
         try:
             LOGGER.debug("Starting gateway client")
             
-            # ??     : ?   ? ?           o  
+            # ??     :  ?           o  
+            # 시작 직후 수신되는 패킷을 놓치지 않도록 콜백을 먼저 등록
             try:
-                await self.client.start()
-                LOGGER.debug("Client started successfully")
+                unsub = self.client.add_device_callback(self._handle_device_update)
+                self._entity_callbacks.append(unsub)
+                LOGGER.debug("Device callback registered")
             except Exception as e:
-                LOGGER.error(f"Failed to start client: {e}")
+                LOGGER.error("Failed to register callback: %s", e)
                 raise
             
-            # ??     :  ?           o  
+            # ??     : ?   ? ?           o  
             try:
-                callback_id = self.client.add_device_callback(self._handle_device_update)
-                self._entity_callbacks.add(callback_id)
-                LOGGER.debug("Device callback registered")
+                await self.client.start()
+                LOGGER.debug("Client started successfully")
             except Exception as e:
-                LOGGER.error(f"Failed to register callback: {e}")
-                # ?   ? ?     
-                await self.client.stop()
+                LOGGER.error("Failed to start client: %s", e)
+                unsub()
+                self._entity_callbacks.remove(unsub)
                 raise
                 
         except Exception as e:
-            LOGGER.error(f"Gateway start failed: {e}")
+            LOGGER.error("Gateway start failed: %s", e)
             raise
         finally:
             self._is_starting = False
         
-    async def async_close(self, event: Event) -> None:
+    async def async_close(self, event: Event | None = None) -> None:
         """Close the gateway."""
         LOGGER.debug("Gateway close requested")
         await self.async_disconnect()
     
-    def get_entities(self, platform: Platform) -> list[KocomPacket]:
+    def get_entities(self, platform: Platform) -> ValuesView[KocomPacket]:
         """Get the entities for the platform."""
-        return list(self.entities.get(platform, {}).values())
+        return self.entities.get(platform, {}).values()
 
-    async def _async_fetch_last_packets(self, entity_id: str) -> list[KocomPacket]:
+    def _async_fetch_last_packets(self, entity_id: str) -> list[KocomPacket]:
         """Fetch the last packets for the entity."""
         try:
             restored_states = restore_state.async_get(self.hass)
             state = restored_states.last_states.get(entity_id)
             
             if not state or not state.extra_data:
-                LOGGER.debug(f"No restored state found for {entity_id}")
+                LOGGER.debug("No restored state found for %s", entity_id)
                 return []
             
             state_dict = state.extra_data.as_dict()
             packet_data = state_dict.get(PACKET_DATA)
             if not packet_data:
-                LOGGER.debug(f"No packet data in restored state for {entity_id}")
+                LOGGER.debug("No packet data in restored state for %s", entity_id)
                 return []
             
             # ??     :    ?       o  
             try:
                 packet = decode_base64_to_bytes(packet_data)
             except Exception as e:
-                LOGGER.warning(f"Failed to decode packet data for {entity_id}: {e}")
+                LOGGER.warning("Failed to decode packet data for %s: %s", entity_id, e)
                 return []
             
             last_data = state_dict.get(LAST_DATA)
-            LOGGER.debug(f"Restored last data for {entity_id}: {last_data}")
+            LOGGER.debug("Restored last data for %s: %s", entity_id, last_data)
 
             # ??     :  ?       o  
             try:
                 packets = PacketParser.parse_state(packet, last_data)
-                LOGGER.debug(f"Successfully parsed {len(packets)} packets for {entity_id}")
+                LOGGER.debug("Successfully parsed %s packets for %s", len(packets), entity_id)
                 return packets
             except Exception as e:
-                LOGGER.warning(f"Failed to parse packet for {entity_id}: {e}")
+                LOGGER.warning("Failed to parse packet for %s: %s", entity_id, e)
                 return []
                 
         except Exception as e:
-            LOGGER.error(f"Error fetching last packets for {entity_id}: {e}")
+            LOGGER.error("Error fetching last packets for %s: %s", entity_id, e)
             return []
     
     async def async_update_entity_registry(self) -> None:
@@ -217,49 +266,80 @@ class KocomGateway:
             entities = er.async_entries_for_config_entry(
                 entity_registry, self.entry.entry_id
             )
+            # 최초 설치 시에는 복원할 엔티티가 없으므로 건너뜀
+            if not entities:
+                return
             
-            LOGGER.debug(f"Found {len(entities)} entities to restore")
+            LOGGER.debug("Found %s entities to restore", len(entities))
             
-            # ??     :   ? o             
-            restore_tasks = []
+            # 복원은 메모리 캐시 조회와 파싱뿐이므로 태스크 없이 순차 처리
+            restored_packets: list[KocomPacket] = []
             for entity in entities:
-                task = self._restore_single_entity(entity.entity_id)
-                restore_tasks.append(task)
+                restored_packets.extend(self._restore_single_entity(entity.entity_id))
             
-            #           ?       ?      
-            if restore_tasks:
-                results = await asyncio.gather(*restore_tasks, return_exceptions=True)
-                
-                #     ?  
-                success_count = 0
-                for i, result in enumerate(results):
-                    if isinstance(result, Exception):
-                        LOGGER.warning(f"Failed to restore entity {entities[i].entity_id}: {result}")
-                    else:
-                        success_count += result
-                
-                LOGGER.info(f"Successfully restored {success_count} entities")
+            # 복원된 패킷은 플랫폼별로 한 번에 디스패치
+            if restored_packets:
+                success_count = self._handle_device_update_bulk(restored_packets)
+                LOGGER.info("Successfully restored %s entities", success_count)
             
         except Exception as e:
-            LOGGER.error(f"Error updating entity registry: {e}")
+            LOGGER.error("Error updating entity registry: %s", e)
     
-    async def _restore_single_entity(self, entity_id: str) -> int:
-        """Restore a single entity and return count of restored packets."""
+    def _restore_single_entity(self, entity_id: str) -> list[KocomPacket]:
+        """Restore a single entity and return its parsed packets."""
         try:
-            packets = await self._async_fetch_last_packets(entity_id)
-            restored_count = 0
-            
-            for packet in packets:
-                try:
-                    await self._handle_device_update(packet)
-                    restored_count += 1
-                except Exception as e:
-                    LOGGER.warning(f"Failed to handle restored packet for {entity_id}: {e}")
-            
-            return restored_count
+            return self._async_fetch_last_packets(entity_id)
         except Exception as e:
-            LOGGER.warning(f"Failed to restore entity {entity_id}: {e}")
-            return 0
+            LOGGER.warning("Failed to restore entity %s: %s", entity_id, e)
+            return []
+    
+    def _get_signals(self, platform: Platform, dev_id: str) -> tuple[str, str]:
+        """Return the cached (add, update) dispatcher signals for a device."""
+        signals = self._signal_cache.get((platform, dev_id))
+        if signals is None:
+            signals = (
+                f"{DOMAIN}_{platform.value}_add",
+                f"{DOMAIN}_{self.host}_{dev_id}",
+            )
+            self._signal_cache[(platform, dev_id)] = signals
+        return signals
+    
+    def mark_unconfirmed(self, dev_id: str) -> None:
+        """Dispatch the device's next frame even if unchanged, to confirm an optimistic state."""
+        self._unconfirmed.add(dev_id)
+    
+    def _store_packet(self, packet: KocomPacket) -> tuple[Platform, str, bool] | None:
+        """Store a device packet and return (platform, dev_id, is_new) if it changed.
+
+        Raises AttributeError if the packet carries no device information.
+        """
+        device = packet._device
+        device_type, room_id, sub_id = device.device_type, device.room_id, device.sub_id
+        
+        platform = self.parse_platform(packet)
+        if platform is None:
+            LOGGER.debug("No platform mapping for packet type: %s", type(packet).__name__)
+            return None
+        
+        dev_id = create_dev_id(device_type, room_id, sub_id)
+        
+        bucket = self.entities.setdefault(platform, {})
+        prev = bucket.setdefault(dev_id, packet)
+        if prev is packet:
+            return platform, dev_id, True
+        
+        # 동일한 패킷/상태의 반복 수신은 기존 객체를 유지하고 디스패치 생략
+        # (엔티티와 같은 객체를 가리키도록 교체하지 않음)
+        if (
+            dev_id not in self._unconfirmed
+            and prev.packet == packet.packet
+            and prev._device.state == device.state
+        ):
+            return None
+        
+        self._unconfirmed.discard(dev_id)
+        bucket[dev_id] = packet
+        return platform, dev_id, False
     
     async def _handle_device_update(self, packet: KocomPacket) -> None:
         """Handle device update with improved safety."""
@@ -267,99 +347,73 @@ class KocomGateway:
             LOGGER.warning("Received null packet")
             return
         
-        # ??     :    u      
-        async with self._packet_lock:
+        try:
+            stored = self._store_packet(packet)
+            if stored is None:
+                return
+            platform, dev_id, is_new_entity = stored
+            
+            add_signal, update_signal = self._get_signals(platform, dev_id)
+            if is_new_entity:
+                async_dispatcher_send(self.hass, add_signal, [packet])
+                LOGGER.debug("New entity added: %s (%s)", dev_id, platform.value)
+            
+            async_dispatcher_send(self.hass, update_signal, packet)
+            
+        except (AttributeError, TypeError, ValueError) as e:
+            LOGGER.warning("Invalid device update %s: %s", packet, e)
+        except Exception as e:
+            LOGGER.error("Error handling device update: %s", e)
+    
+    def _handle_device_update_bulk(self, packets: list[KocomPacket]) -> int:
+        """Store packets and send one add signal per platform for new entities."""
+        new_packets: dict[Platform, tuple[str, list[KocomPacket]]] = {}
+        handled_count = 0
+        
+        for packet in packets:
             try:
-                # ??     :   ?     
-                if not hasattr(packet, '_device') or not packet._device:
-                    LOGGER.warning(f"Packet missing device information: {packet}")
-                    return
-                
-                device = packet._device
-                
-                # ??     :     ?           
-                if not all(hasattr(device, attr) for attr in ['device_type', 'room_id', 'sub_id']):
-                    LOGGER.warning(f"Device missing required attributes: {device}")
-                    return
-                
-                platform = self.parse_platform(packet)
-                if platform is None:
-                    LOGGER.debug(f"No platform mapping for packet type: {type(packet).__name__}")
-                    return
-                
-                # ??     : dev_id           o  
-                try:
-                    dev_id = create_dev_id(device.device_type, device.room_id, device.sub_id)
-                except Exception as e:
-                    LOGGER.warning(f"Failed to create device ID: {e}")
-                    return
-                
-                # ??     :         ? ?
-                if platform not in self.entities:
-                    self.entities[platform] = {}
-                
-                # ??     :  ?      ?  
-                is_new_entity = dev_id not in self.entities[platform]
-                
-                #   ??    /      ?
-                self.entities[platform][dev_id] = packet
-                
-                # ??     :   ?           o  
-                try:
-                    if is_new_entity:
-                        add_signal = f"{DOMAIN}_{platform.value}_add"
-                        async_dispatcher_send(self.hass, add_signal, packet)
-                        LOGGER.debug(f"New entity added: {dev_id} ({platform.value})")
-                    
-                    packet_update_signal = f"{DOMAIN}_{self.host}_{dev_id}"
-                    async_dispatcher_send(self.hass, packet_update_signal, packet)
-                    
-                except Exception as e:
-                    LOGGER.warning(f"Failed to send update signal for {dev_id}: {e}")
-                
+                stored = self._store_packet(packet)
             except Exception as e:
-                LOGGER.error(f"Error handling device update: {e}")
+                LOGGER.warning("Failed to handle restored packet: %s", e)
+                continue
+            
+            handled_count += 1
+            if stored is None:
+                continue
+            
+            platform, dev_id, is_new_entity = stored
+            add_signal, update_signal = self._get_signals(platform, dev_id)
+            if is_new_entity:
+                new_packets.setdefault(platform, (add_signal, []))[1].append(packet)
+            else:
+                async_dispatcher_send(self.hass, update_signal, packet)
+        
+        for platform, (add_signal, platform_packets) in new_packets.items():
+            async_dispatcher_send(self.hass, add_signal, platform_packets)
+            LOGGER.debug("New entities added: %s (%s)", len(platform_packets), platform.value)
+        
+        return handled_count
         
     def parse_platform(self, packet: KocomPacket) -> Platform | None:
         """Parse the platform from the packet with improved validation."""
         try:
-            # ??     :   ? ?       
-            if not isinstance(packet, KocomPacket):
-                LOGGER.warning(f"Invalid packet type: {type(packet)}")
-                return None
-            
-            platform = PLATFORM_MAPPING.get(type(packet))
-            if platform is None:
-                LOGGER.debug(f"No platform mapping for: {type(packet).__name__}")
+            type_id = packet._TYPE_ID
+            resolver = _PLATFORM_RESOLVERS[type_id] if type_id < len(_PLATFORM_RESOLVERS) else None
+            if resolver is None:
+                LOGGER.debug("No platform mapping for: %s", type(packet).__name__)
                 return None
             
-            # ??     : sub_id            
-            platform_packet_types = (ThermostatPacket, FanPacket, EVPacket)
-            if isinstance(packet, platform_packet_types):
-                try:
-                    sub_id = getattr(packet._device, 'sub_id', None) if packet._device else None
-                    if sub_id:
-                        if ERROR in sub_id:
-                            platform = Platform.BINARY_SENSOR
-                        elif CO2 in sub_id or TEMPERATURE in sub_id:
-                            platform = Platform.SENSOR
-                        elif sub_id in {DIRECTION, FLOOR}:  # EV
-                            platform = Platform.SENSOR
-                except Exception as e:
-                    LOGGER.warning(f"Error checking sub_id: {e}")
-                    #  ?            
-                    
-            return platform
+            return resolver(packet)
             
         except Exception as e:
-            LOGGER.error(f"Error parsing platform: {e}")
+            LOGGER.error("Error parsing platform: %s", e)
             return None
     
     # ??     :      ?    ?     ? 
     def is_connected(self) -> bool:
         """Check if gateway is connected and ready."""
         return (
-            self.connection.is_connected() and 
+            self.connection.connected and 
             self.client is not None and 
             not self._is_stopping
         )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
 from homeassistant.components.light import LightEntity, ColorMode, ATTR_BRIGHTNESS
@@ -30,31 +31,33 @@ async def async_setup_entry(
         gateway: KocomGateway = hass.data[DOMAIN][entry.entry_id]
         
         @callback
-        def async_add_light(packet: KocomPacket) -> None:
-            """Add new light entity."""
-            try:
-                if isinstance(packet, LightPacket):
-                    entity = KocomLightEntity(gateway, packet)
-                    async_add_entities([entity])
-                    LOGGER.debug(f"Added light entity: {entity.unique_id}")
-                else:
-                    LOGGER.warning(f"Invalid packet type for light: {type(packet)}")
-            except Exception as e:
-                LOGGER.error(f"Failed to add light entity: {e}")
+        def async_add_light(packets: Iterable[KocomPacket]) -> None:
+            """Add new light entities."""
+            entities: list[KocomLightEntity] = []
+            for packet in packets:
+                try:
+                    if isinstance(packet, LightPacket):
+                        entity = KocomLightEntity(gateway, packet)
+                        entities.append(entity)
+                        LOGGER.debug("Added light entity: %s", entity.unique_id)
+                    else:
+                        LOGGER.warning("Invalid packet type for light: %s", type(packet))
+                except Exception as e:
+                    LOGGER.error("Failed to add light entity: %s", e)
+            async_add_entities(entities)
 
         # ??     :        ƼƼ  ߰          ó  
         existing_entities = gateway.get_entities(Platform.LIGHT)
-        for entity in existing_entities:
-            async_add_light(entity)
+        async_add_light(existing_entities)
             
         entry.async_on_unload(
             async_dispatcher_connect(hass, f"{DOMAIN}_light_add", async_add_light)
         )
         
-        LOGGER.info(f"Light platform setup completed with {len(existing_entities)} entities")
+        LOGGER.info("Light platform setup completed with %s entities", len(existing_entities))
         
     except Exception as e:
-        LOGGER.error(f"Failed to setup light platform: {e}")
+        LOGGER.error("Failed to setup light platform: %s", e)
         raise
 
 
@@ -74,18 +77,29 @@ class KocomLightEntity(KocomEntity, LightEntity):
         self.has_brightness = False
         self.max_brightness = 0
         self._last_brightness = DEFAULT_BRIGHTNESS
+        self._level_key: list | None = None
+        self._level_to_ha: dict[int, int] = {}
+        self._ha_to_level: tuple[int, ...] = ()
+        self._cached_state: dict[str, Any] = {}
+        self._power = False
+        self._raw_brightness: int | None = None
+        self._level_list: list | tuple = ()
+        self._attrs_cache: dict[str, Any] | None = None
+        self._brightness_cache: int | None = None
+        self._brightness_cached = False
         
         # ??     :  ʱ ȭ             Ȯ  
         self._update_brightness_support()
+        self._snapshot_state()
 
     def _update_brightness_support(self) -> None:
         """Update brightness support based on device state."""
         try:
-            device_state = self.packet._device.state
+            device_state = self._cached_state = self.packet._device.state or {}
             
             # ??     :                 
             if not device_state:
-                LOGGER.warning(f"No device state for light {self.unique_id}")
+                LOGGER.warning("No device state for light %s", self.unique_id)
                 return
             
             #          Ȯ  
@@ -98,53 +112,76 @@ class KocomLightEntity(KocomEntity, LightEntity):
                 level_list = device_state.get(LEVEL, [])
                 if isinstance(level_list, (list, tuple)) and level_list:
                     self.max_brightness = len(level_list)
+                    self._update_level_tables(level_list)
                 else:
-                    LOGGER.warning(f"Invalid LEVEL data for {self.unique_id}: {level_list}")
+                    LOGGER.warning("Invalid LEVEL data for %s: %s", self.unique_id, level_list)
                     self.max_brightness = 3  #  ⺻  
                     
-                LOGGER.debug(f"Light {self.unique_id} supports brightness: max={self.max_brightness}")
+                LOGGER.debug("Light %s supports brightness: max=%s", self.unique_id, self.max_brightness)
             else:
                 self.has_brightness = False
                 self._attr_supported_color_modes = {ColorMode.ONOFF}
                 self._attr_color_mode = ColorMode.ONOFF
                 
         except Exception as e:
-            LOGGER.error(f"Error updating brightness support for {self.unique_id}: {e}")
+            LOGGER.error("Error updating brightness support for %s: %s", self.unique_id, e)
+            self._cached_state = {}
             #         ⺻       
             self.has_brightness = False
             self._attr_supported_color_modes = {ColorMode.ONOFF}
             self._attr_color_mode = ColorMode.ONOFF
 
+    def _snapshot_state(self) -> None:
+        """Copy the fields read by the state properties out of the device state."""
+        state = self._cached_state
+        self._power = state.get(POWER, False)
+        self._raw_brightness = state.get(BRIGHTNESS)
+        self._level_list = state.get(LEVEL) or ()
+
     @property
     def is_on(self) -> bool:
         """Return true if light is on."""
-        try:
-            # ??     :            Ȯ   (            )
-            self._update_brightness_support()
-            
-            device_state = self.packet._device.state
-            if not device_state:
-                return False
-                
-            return device_state.get(POWER, False)
-            
-        except Exception as e:
-            LOGGER.error(f"Error getting power state for {self.unique_id}: {e}")
-            return False
+        # 상태는 패킷 수신 시에만 스냅샷되므로 필드만 반환
+        return self._power
     
+    def _update_level_tables(self, level_list: list) -> None:
+        """Rebuild the brightness lookup tables when LEVEL changes."""
+        if self._level_key == level_list:
+            return
+        
+        count = len(level_list)
+        self._level_to_ha = {
+            level: max(MIN_BRIGHTNESS, min(MAX_BRIGHTNESS, int((i + 1) / count * MAX_BRIGHTNESS)))
+            for i, level in enumerate(level_list)
+        }
+        self._ha_to_level = tuple(
+            level_list[max(0, min(count - 1, int(ha / MAX_BRIGHTNESS * count)))]
+            for ha in range(MAX_BRIGHTNESS + 1)
+        )
+        # LEVEL 목록은 파서가 제자리에서 갱신하므로 복사본을 키로 보관
+        self._level_key = list(level_list)
+
+    def _invalidate_caches(self) -> None:
+        """Drop values derived from the current device state."""
+        self._attrs_cache = None
+        self._brightness_cached = False
+
     @property
     def brightness(self) -> int | None:
         """Return the brightness of this light between 0..255."""
+        if not self._brightness_cached:
+            self._brightness_cache = self._compute_brightness()
+            self._brightness_cached = True
+        return self._brightness_cache
+
+    def _compute_brightness(self) -> int | None:
+        """Compute the brightness from the cached device state."""
         if not self.has_brightness:
             return None
             
         try:
-            device_state = self.packet._device.state
-            if not device_state:
-                return None
-            
-            current_brightness = device_state.get(BRIGHTNESS)
-            level_list = device_state.get(LEVEL, [])
+            current_brightness = self._raw_brightness
+            level_list = self._level_list
             
             # ??     :            
             if current_brightness is None:
@@ -152,30 +189,19 @@ class KocomLightEntity(KocomEntity, LightEntity):
                 
             # ??     :           Ȯ  
             if not isinstance(level_list, (list, tuple)):
-                LOGGER.warning(f"Invalid LEVEL data for {self.unique_id}")
+                LOGGER.warning("Invalid LEVEL data for %s", self.unique_id)
                 return DEFAULT_BRIGHTNESS
             
-            # ??     :        Ⱑ                     
-            if current_brightness not in level_list:
-                #  ִ           
-                return MAX_BRIGHTNESS
-            
-            # ??     :  ùٸ          (255     )
-            if self.max_brightness > 0:
-                brightness_ratio = (level_list.index(current_brightness) + 1) / self.max_brightness
-                calculated_brightness = int(brightness_ratio * MAX_BRIGHTNESS)
-                
-                #          
-                return max(MIN_BRIGHTNESS, min(MAX_BRIGHTNESS, calculated_brightness))
-            
-            return DEFAULT_BRIGHTNESS
+            # 레벨별 HA 밝기는 패킷 수신 시 계산된 테이블에서 조회 (목록에 없으면 최대 밝기)
+            return self._level_to_ha.get(current_brightness, MAX_BRIGHTNESS)
             
         except Exception as e:
-            LOGGER.error(f"Error calculating brightness for {self.unique_id}: {e}")
+            LOGGER.error("Error calculating brightness for %s: %s", self.unique_id, e)
             return self._last_brightness
     
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on light."""
+        optimistic_brightness: int | None = None
         try:
             if self.has_brightness and ATTR_BRIGHTNESS in kwargs:
                 # ??     :              
@@ -185,74 +211,88 @@ class KocomLightEntity(KocomEntity, LightEntity):
                 requested_brightness = max(MIN_BRIGHTNESS, min(MAX_BRIGHTNESS, requested_brightness))
                 
                 # ??     :  ùٸ          
-                device_state = self.packet._device.state
-                level_list = device_state.get(LEVEL, [])
-                
-                if not level_list:
-                    LOGGER.error(f"No brightness levels available for {self.unique_id}")
+                if not self._ha_to_level:
+                    LOGGER.error("No brightness levels available for %s", self.unique_id)
                     #  ⺻ ON           ü
                     make_packet = self.packet.make_power_status(True)
                 else:
-                    #   ⸦       ε        ȯ
-                    brightness_ratio = requested_brightness / MAX_BRIGHTNESS
-                    level_index = int(brightness_ratio * len(level_list))
-                    level_index = max(0, min(len(level_list) - 1, level_index))
+                    target_brightness = self._ha_to_level[requested_brightness]
                     
-                    target_brightness = level_list[level_index]
-                    
-                    LOGGER.debug(f"Setting brightness for {self.unique_id}: {requested_brightness} -> level {target_brightness}")
+                    LOGGER.debug("Setting brightness for %s: %s -> level %s", self.unique_id, requested_brightness, target_brightness)
                     make_packet = self.packet.make_brightness_status(target_brightness)
+                    optimistic_brightness = target_brightness
                     
                 self._last_brightness = requested_brightness
             else:
                 #  Ϲ  ON    
                 make_packet = self.packet.make_power_status(True)
 
-            await self.send_packet(make_packet)
+            if await self.send_packet(make_packet):
+                self._apply_optimistic_state(True, optimistic_brightness)
             
         except Exception as e:
-            LOGGER.error(f"Failed to turn on light {self.unique_id}: {e}")
+            LOGGER.error("Failed to turn on light %s: %s", self.unique_id, e)
+
+    def _apply_optimistic_state(self, power: bool, brightness: int | None = None) -> None:
+        """Reflect a queued command in the UI before the device echoes it."""
+        if not self._cached_state:
+            return
+        # 패킷의 상태 딕셔너리는 건드리지 않고 엔티티 필드에만 반영
+        # (다음 장치 프레임 수신 시 스냅샷으로 확정 또는 원복)
+        self._power = power
+        if brightness is not None:
+            self._raw_brightness = brightness
+        self._invalidate_caches()
+        self._mark_optimistic()
+        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off light."""
         try:
             make_packet = self.packet.make_power_status(False)
-            await self.send_packet(make_packet)
+            if await self.send_packet(make_packet):
+                self._apply_optimistic_state(False)
             
         except Exception as e:
-            LOGGER.error(f"Failed to turn off light {self.unique_id}: {e}")
+            LOGGER.error("Failed to turn off light %s: %s", self.unique_id, e)
 
     # ??     :            Ʈ    ȣ  Ǵ   ޼   
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
+    def _handle_packet_update(self) -> None:
+        """Refresh brightness support when a new packet arrives."""
         try:
-            super()._handle_coordinator_update()
+            super()._handle_packet_update()
+            self._invalidate_caches()
             
             #            Ȯ  
             self._update_brightness_support()
+            self._snapshot_state()
             
         except Exception as e:
-            LOGGER.error(f"Error handling coordinator update for {self.unique_id}: {e}")
+            LOGGER.error("Error handling packet update for %s: %s", self.unique_id, e)
 
     # ??     :               ߰   Ӽ 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return extra state attributes."""
+        # 패킷 갱신 전까지는 이전에 만든 속성 딕셔너리를 그대로 반환
+        if self._attrs_cache is not None:
+            return self._attrs_cache
+
         try:
-            attrs = super().extra_state_attributes or {}
+            attrs = dict(super().extra_state_attributes or {})
             
-            device_state = self.packet._device.state
-            if device_state:
+            if self._cached_state:
                 attrs.update({
                     "has_brightness": self.has_brightness,
                     "max_brightness": self.max_brightness,
-                    "device_brightness": device_state.get(BRIGHTNESS),
-                    "device_levels": device_state.get(LEVEL),
+                    "device_brightness": self._raw_brightness,
+                    "device_levels": self._level_list or None,
                     "last_brightness": self._last_brightness,
                 })
             
+            self._attrs_cache = attrs
             return attrs
             
         except Exception as e:
-            LOGGER.error(f"Error getting extra attributes for {self.unique_id}: {e}")
+            LOGGER.error("Error getting extra attributes for %s: %s", self.unique_id, e)
             return None
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-from queue import Queue, Empty
+import inspect
+import logging
+import struct
+from functools import partial
 from typing import Optional, Callable, Awaitable
 import weakref
 
@@ -11,46 +14,69 @@ from ..connection import Connection
 
 from .crc import verify_checksum, calculate_checksum
 from .packet import PacketParser
-from .const import _LOGGER, PREFIX_HEADER, SUFFIX_HEADER
+from .const import _LOGGER, PREFIX_HEADER, SUFFIX_HEADER, MIN_PACKET_LEN
+
+_PREFIX_LEN = len(PREFIX_HEADER)
+_SUFFIX_LEN = len(SUFFIX_HEADER)
+_PREFIX_FIRST = PREFIX_HEADER[:1]
+_MAX_RETRY_DELAY = 1.0
+_MAX_QUEUE_SIZE = 64  # 링크 정지 시 전송 대기 프레임이 무한히 쌓이지 않도록 제한
+# 테일러 비교용 2바이트 정수 (슬라이스 bytes 생성 없이 비교)
+_U16 = struct.Struct("<H")
+_SUFFIX_U16 = _U16.unpack(SUFFIX_HEADER)[0]
 
 
 class PacketQueue:
-    """Manages the queue for packet transmission with thread safety."""
+    """Manages the queue for packet transmission on the event loop."""
 
-    def __init__(self):
-        self._queue = Queue()
+    def __init__(self, maxsize: int = _MAX_QUEUE_SIZE):
+        # 이벤트 루프 단일 스레드에서만 접근하므로 잠금 없이 asyncio.Queue 사용
+        self._queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize)
+        self._tail: Optional[bytes] = None  # 마지막으로 큐에 넣은 프레임
         self._pause = asyncio.Event()
         self._pause.set()  # Initially not paused
-        self._has_items = asyncio.Event()
-        self._lock = asyncio.Lock()  # ?? ����: ���ü� ����
 
-    async def add_packet(self, packet: bytes) -> None:
-        """Add a packet to the queue safely."""
-        async with self._lock:
-            try:
-                self._queue.put_nowait(packet)
-                self._has_items.set()
-                _LOGGER.debug(f"Added packet to queue: {packet.hex()}")
-            except Exception as e:
-                _LOGGER.error(f"Failed to add packet to queue: {e}")
+    def add_packet(self, packet: bytes) -> bool:
+        """Add a packet to the queue unless it repeats the last pending one.
 
-    async def get_packet(self) -> Optional[bytes]:
-        """Get a packet from the queue safely."""
-        async with self._lock:
-            try:
-                packet = self._queue.get_nowait()
-                
-                # ?? ����: ť ���� ��Ȯ�� Ȯ��
-                if self._queue.empty():
-                    self._has_items.clear()
-                    
-                return packet
-            except Empty:
-                self._has_items.clear()
-                return None
-            except Exception as e:
-                _LOGGER.error(f"Error getting packet from queue: {e}")
-                return None
+        Returns False if the queue is full and the packet was dropped.
+        """
+        # FIFO이므로 큐가 비어 있지 않으면 마지막 프레임은 아직 미전송 상태
+        # (끝 프레임과 같을 때만 병합해야 A, B, A 순서의 명령이 뒤바뀌지 않음)
+        if packet == self._tail and not self._queue.empty():
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Skipped duplicate packet: %s", packet.hex())
+            return True
+        try:
+            self._queue.put_nowait(packet)
+        except asyncio.QueueFull:
+            _LOGGER.warning("Send queue full, dropping packet: %s", packet.hex())
+            return False
+        self._tail = packet
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Added packet to queue: %s", packet.hex())
+        return True
+
+    def get_packet(self) -> Optional[bytes]:
+        """Get a packet from the queue, or None if it is empty."""
+        try:
+            return self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
+    def clear(self) -> int:
+        """Drop all pending packets and return how many were dropped."""
+        count = self._queue.qsize()
+        for _ in range(count):
+            self._queue.get_nowait()
+        return count
+
+    async def next_packet(self) -> bytes:
+        """Wait until the queue is resumed and return the next packet."""
+        # 일시정지 상태가 아니면 이벤트 대기 코루틴을 만들지 않음
+        if not self._pause.is_set():
+            await self._pause.wait()
+        return await self._queue.get()
 
     async def pause(self) -> None:
         """Pause the queue processing."""
@@ -62,10 +88,6 @@ class PacketQueue:
         self._pause.set()
         _LOGGER.debug("Queue processing resumed")
 
-    async def wait_for_packet(self) -> None:
-        """Wait until there is a packet in the queue."""
-        await self._has_items.wait()
-
     async def wait_for_resume(self) -> None:
         """Wait until the queue is resumed."""
         await self._pause.wait()
@@ -86,22 +108,30 @@ class KocomClient:
         self,
         connection: Connection,
         timeout: float = 0.25,
-        max_retries: int = 5
+        max_retries: int = 5,
+        batch_size: int = 8,
+        callback_timeout: float | None = None,
     ) -> None:
         """Initialize the KocomClient."""
         self.connection = connection
         self.timeout = timeout
         self.max_retries = max_retries
+        self.batch_size = batch_size
+        # None이면 콜백마다 타이머를 두지 않음 (느린 콜백은 asyncio 디버그 경고로 확인)
+        self.callback_timeout = callback_timeout
 
         self.tasks: list[asyncio.Task] = []
-        self.device_callbacks: list[Callable[[dict], Awaitable[None]]] = []
+        # 바운드 메서드는 WeakMethod로 보관해 소유 객체가 사라지면 자동 해제
+        self.device_callbacks: dict[int, Callable[[dict], Awaitable[None]] | weakref.WeakMethod] = {}
+        self._next_callback_id = 0
         self.packet_queue = PacketQueue()
+        self._tx_scratch = bytearray(64)
+        self._rx_buffer = bytearray()  # 읽기 사이에 이어지는 미완성 프레임 보관
         
         # ?? ����: ���� ����
         self._is_running = False
         self._listen_task: Optional[asyncio.Task] = None
         self._queue_task: Optional[asyncio.Task] = None
-        self._callback_lock = asyncio.Lock()  # �ݹ� ���� ���ü� ����
 
     async def start(self) -> None:
         """Start the client."""
@@ -123,7 +153,7 @@ class KocomClient:
             _LOGGER.info("Kocom Client started successfully")
             
         except Exception as e:
-            _LOGGER.error(f"Failed to start client: {e}")
+            _LOGGER.error("Failed to start client: %s", e)
             await self.stop()
             raise
 
@@ -160,30 +190,46 @@ class KocomClient:
             # ?? ����: ������ ����
             self.tasks.clear()
             self.device_callbacks.clear()
+            self._rx_buffer.clear()
             
             _LOGGER.info("Kocom Client stopped successfully")
             
         except Exception as e:
-            _LOGGER.error(f"Error during client stop: {e}")
-
-    def add_device_callback(self, callback: Callable[[dict], Awaitable[None]]) -> int:
-        """Add callback for device updates and return callback ID."""
-        callback_id = len(self.device_callbacks)
-        self.device_callbacks.append(callback)
-        _LOGGER.debug(f"Added device callback {callback_id}")
-        return callback_id
+            _LOGGER.error("Error during client stop: %s", e)
+
+    def add_device_callback(
+        self, callback: Callable[[dict], Awaitable[None]]
+    ) -> Callable[[], bool]:
+        """Add callback for device updates and return a function that removes it."""
+        callback_id = self._next_callback_id
+        self._next_callback_id += 1
+        if inspect.ismethod(callback):
+            self.device_callbacks[callback_id] = weakref.WeakMethod(
+                callback, partial(self._drop_dead_callback, callback_id)
+            )
+        else:
+            self.device_callbacks[callback_id] = callback
+        _LOGGER.debug("Added device callback %s", callback_id)
+        return partial(self.remove_device_callback, callback_id)
+
+    def _drop_dead_callback(self, callback_id: int, _ref: weakref.WeakMethod) -> None:
+        """Forget a callback whose owner has been garbage collected."""
+        if self.device_callbacks.pop(callback_id, None) is not None:
+            _LOGGER.debug("Dropped collected device callback %s", callback_id)
+
+    @staticmethod
+    def _resolve_callback(entry) -> Callable[[dict], Awaitable[None]] | None:
+        """Return the live callable behind a stored callback entry."""
+        if isinstance(entry, weakref.WeakMethod):
+            return entry()
+        return entry
 
     def remove_device_callback(self, callback_id: int) -> bool:
         """Remove device callback by ID."""
-        try:
-            if 0 <= callback_id < len(self.device_callbacks):
-                self.device_callbacks[callback_id] = None  # None���� ��ŷ
-                _LOGGER.debug(f"Removed device callback {callback_id}")
-                return True
-            return False
-        except Exception as e:
-            _LOGGER.error(f"Error removing callback {callback_id}: {e}")
+        if self.device_callbacks.pop(callback_id, None) is None:
             return False
+        _LOGGER.debug("Removed device callback %s", callback_id)
+        return True
     
     async def _listen(self) -> None:
         """Listen for incoming packets with improved error handling."""
@@ -195,9 +241,10 @@ class KocomClient:
         while self._is_running:
             try:
                 # ?? ����: ���� ���� Ȯ��
-                if not self.connection.is_connected():
+                if not self.connection.connected:
                     _LOGGER.warning("Connection lost in listener, waiting...")
-                    await asyncio.sleep(1.0)
+                    if await self.connection.wait_connected(1.0):
+                        continue
                     consecutive_errors += 1
                     
                     if consecutive_errors >= max_consecutive_errors:
@@ -226,7 +273,7 @@ class KocomClient:
                 break
             except Exception as e:
                 consecutive_errors += 1
-                _LOGGER.error(f"Error in listener (consecutive: {consecutive_errors}): {e}")
+                _LOGGER.error("Error in listener (consecutive: %s): %s", consecutive_errors, e)
                 
                 # ?? ����: �ʹ� ���� ���� ���� �� �ߴ�
                 if consecutive_errors >= max_consecutive_errors:
@@ -240,86 +287,119 @@ class KocomClient:
 
     async def _process_received_packet(self, packet: bytes) -> None:
         """Process a single received packet."""
+        # 길이가 부족한 잡음 프레임은 체크섬 계산 전에 폐기
+        if len(packet) < MIN_PACKET_LEN:
+            return
+        
         try:
             # üũ�� ����
             if not verify_checksum(packet):
-                _LOGGER.debug(f"Checksum verification failed: {packet.hex()}")
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Checksum verification failed: %s", packet.hex())
                 return
 
             # ��Ŷ �Ľ�
             try:
                 parsed_packets = PacketParser.parse_state(packet)
             except Exception as e:
-                _LOGGER.warning(f"Failed to parse packet {packet.hex()}: {e}")
+                _LOGGER.warning("Failed to parse packet %s: %s", packet.hex(), e)
                 return
             
             # ?? ����: �Ľ̵� ��Ŷ ó��
             for parsed_packet in parsed_packets:
                 if parsed_packet:
-                    _LOGGER.debug(f"Received: {type(parsed_packet).__name__}")
+                    _LOGGER.debug("Received: %s", type(parsed_packet).__name__)
                     await self._notify_callbacks(parsed_packet)
                     
         except Exception as e:
-            _LOGGER.error(f"Error processing packet {packet.hex()}: {e}")
+            _LOGGER.error("Error processing packet %s: %s", packet.hex(), e)
 
     async def _notify_callbacks(self, parsed_packet) -> None:
         """Notify all callbacks about packet with error isolation."""
-        async with self._callback_lock:
-            active_callbacks = [cb for cb in self.device_callbacks if cb is not None]
-            
-            if not active_callbacks:
-                return
-            
-            # ?? ����: �ݹ麰 ���� ���� ó��
-            callback_tasks = []
-            for i, callback in enumerate(active_callbacks):
-                task = self._safe_callback_execution(callback, parsed_packet, i)
-                callback_tasks.append(task)
-            
-            # ��� �ݹ��� ���ķ� ����
-            if callback_tasks:
-                await asyncio.gather(*callback_tasks, return_exceptions=True)
+        callbacks = self.device_callbacks
+        if not callbacks:
+            return
+        
+        # 콜백이 하나뿐이면 태스크/gather 없이 바로 실행
+        if len(callbacks) == 1:
+            callback_id, entry = next(iter(callbacks.items()))
+            callback = self._resolve_callback(entry)
+            if callback is not None:
+                await self._safe_callback_execution(callback, parsed_packet, callback_id)
+            return
+        
+        # 여러 콜백은 eager 태스크로 실행해 중단 없이 끝나는 콜백은 즉시 완료
+        # (eager 실행 중 콜백 해제가 일어날 수 있으므로 스냅샷을 순회)
+        loop = asyncio.get_running_loop()
+        live_callbacks = [
+            (callback_id, callback)
+            for callback_id, entry in list(callbacks.items())
+            if (callback := self._resolve_callback(entry)) is not None
+        ]
+        callback_tasks = [
+            asyncio.Task(
+                self._safe_callback_execution(callback, parsed_packet, callback_id),
+                loop=loop,
+                eager_start=True,
+            )
+            for callback_id, callback in live_callbacks
+        ]
+        # eager 실행으로 이미 끝난 콜백은 제외하고 나머지만 동시에 대기
+        pending = [task for task in callback_tasks if not task.done()]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
 
     async def _safe_callback_execution(self, callback, packet, callback_id: int) -> None:
-        """Safely execute a callback with timeout."""
+        """Safely execute a callback, with a timeout only if one is configured."""
         try:
-            await asyncio.wait_for(callback(packet), timeout=5.0)
-        except asyncio.TimeoutError:
-            _LOGGER.warning(f"Callback {callback_id} timed out")
+            result = callback(packet)
+            if inspect.isawaitable(result):
+                if self.callback_timeout is None:
+                    await result
+                else:
+                    async with asyncio.timeout(self.callback_timeout):
+                        await result
+        except TimeoutError:
+            _LOGGER.warning("Callback %s timed out", callback_id)
         except Exception as e:
-            _LOGGER.error(f"Callback {callback_id} failed: {e}")
+            _LOGGER.error("Callback %s failed: %s", callback_id, e)
     
     def extract_packets(self, data: bytes) -> list[bytes]:
-        """Extract packets from the received data with improved validation."""
+        """Extract fixed-length frames, keeping a trailing partial frame for the next read."""
+        buffer = self._rx_buffer
+        if buffer:
+            # 이전 읽기의 미완성 프레임이 있을 때만 버퍼에 이어 붙여 스캔
+            buffer += data
+            data = buffer
         packets: list[bytes] = []
-        start = 0
-
-        try:
-            while start < len(data):
-                start_pos = data.find(PREFIX_HEADER, start)
-                if start_pos == -1:
-                    break
-
-                end_pos = data.find(SUFFIX_HEADER, start_pos + len(PREFIX_HEADER))
-                if end_pos == -1:
-                    break
-
-                packet = data[start_pos:end_pos + len(SUFFIX_HEADER)]
-                
-                # ?? ����: ��Ŷ ���� ����
-                if len(packet) < len(PREFIX_HEADER) + len(SUFFIX_HEADER) + 1:  # �ּ� ����
-                    _LOGGER.debug(f"Packet too short: {packet.hex()}")
-                    start = end_pos + len(SUFFIX_HEADER)
-                    continue
-                
-                packets.append(packet)
-                start = end_pos + len(SUFFIX_HEADER)
-
-            return packets
-            
-        except Exception as e:
-            _LOGGER.error(f"Error extracting packets: {e}")
-            return []
+        packets_append = packets.append
+        find = data.find
+        unpack_u16 = _U16.unpack_from
+        last_start = len(data) - MIN_PACKET_LEN
+
+        # 헤더 위치에서 고정 길이 창의 테일러를 확인 (본문 내 0D0D로 잘리지 않음)
+        start = find(PREFIX_HEADER)
+        while 0 <= start <= last_start:
+            end = start + MIN_PACKET_LEN
+            if unpack_u16(data, end - _SUFFIX_LEN)[0] == _SUFFIX_U16:
+                packets_append(bytes(data[start:end]))
+                start = find(PREFIX_HEADER, end)
+            else:
+                # 테일러 불일치: 다음 헤더 후보로 재동기화
+                start = find(PREFIX_HEADER, start + 1)
+
+        # 읽기 경계에 걸친 프레임은 남겨두고 소비한 앞부분만 제거
+        if start < 0:
+            # 헤더가 없으면 마지막 바이트가 헤더 첫 바이트일 때만 유지
+            # (그 외에는 버퍼를 비워 다음 읽기가 제자리 스캔 경로를 타도록 함)
+            start = len(data)
+            if data[-1:] == _PREFIX_FIRST:
+                start -= 1
+        if data is buffer:
+            del buffer[:start]
+        else:
+            buffer += data[start:]
+        return packets
     
     async def _process_queue(self) -> None:
         """Process packets in the queue with improved error handling."""
@@ -328,32 +408,62 @@ class KocomClient:
         while self._is_running:
             try:
                 # ��Ŷ�� �簳 ���� ���
-                await asyncio.gather(
-                    self.packet_queue.wait_for_packet(),
-                    self.packet_queue.wait_for_resume(),
-                )
-
-                packet = await self.packet_queue.get_packet()
-                if packet is None:
-                    continue
+                packet = await self.packet_queue.next_packet()
+                
+                # 대기 중인 패킷을 최대 batch_size개까지 모아 한 번에 전송
+                batch = [packet]
+                while len(batch) < self.batch_size:
+                    next_packet = self.packet_queue.get_packet()
+                    if next_packet is None:
+                        break
+                    batch.append(next_packet)
                 
                 # ?? ����: ���� ���� Ȯ�� �� ����
-                if not self.connection.is_connected():
-                    _LOGGER.warning("Cannot send packet: connection lost")
-                    await asyncio.sleep(1.0)
-                    continue
+                # 연결이 끊겨 있으면 꺼낸 패킷을 버리지 않고 재연결될 때까지 보관
+                if not self.connection.connected:
+                    _LOGGER.warning("Connection lost, holding %s packets until reconnected", len(batch))
+                    if not await self._wait_for_connection():
+                        break
                 
-                await self._send_packet_with_retry(packet)
+                # 전송 후 ACK를 폴링하지 않음: 장치 응답은 _listen 경로에서 콜백으로 반영
+                await self._send_batch(batch)
                     
             except asyncio.CancelledError:
                 _LOGGER.debug("Queue processor cancelled")
                 break
             except Exception as e:
-                _LOGGER.error(f"Error in queue processor: {e}")
+                _LOGGER.error("Error in queue processor: %s", e)
                 await asyncio.sleep(0.1)  # ª�� ��� �� ��õ�
         
         _LOGGER.debug("Queue processor stopped")
 
+    async def _wait_for_connection(self) -> bool:
+        """Wait until the connection is back, or return False once the client stops."""
+        while not await self.connection.wait_connected(1.0):
+            if not self._is_running:
+                return False
+        return True
+
+    async def _send_batch(self, packets: list[bytes]) -> None:
+        """Send queued packets with a single drain, retrying unconfirmed ones one by one."""
+        sent = 0
+        if len(packets) > 1:
+            try:
+                _LOGGER.debug("Sending batch of %s packets", len(packets))
+                sent = await self.connection.send_many(packets)
+                if sent == len(packets):
+                    return
+            except Exception as e:
+                _LOGGER.error("Batch send error: %s", e)
+        
+        # 전송이 확인되지 않은 패킷만 개별 재시도 (연결이 끊기면 재연결 후 이어서 전송)
+        for packet in packets[sent:]:
+            while not await self._send_packet_with_retry(packet):
+                if self.connection.connected:
+                    break  # 재시도 횟수 초과: 이 패킷만 포기
+                if not await self._wait_for_connection():
+                    return
+
     async def _send_packet_with_retry(self, packet: bytes) -> bool:
         """Send packet with retry logic."""
         retries = 0
@@ -361,27 +471,32 @@ class KocomClient:
         while retries < self.max_retries and self._is_running:
             try:
                 # ?? ����: ��õ� �� ���� ���� ��Ȯ��
-                if not self.connection.is_connected():
-                    _LOGGER.warning(f"Connection lost during retry {retries}")
+                if not self.connection.connected:
+                    _LOGGER.warning("Connection lost during retry %s", retries)
                     return False
                 
-                _LOGGER.debug(f"Sending packet (attempt {retries + 1}): {packet.hex()}")
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Sending packet (attempt %s): %s", retries + 1, packet.hex())
                 
                 success = await self.connection.send(packet)
                 if success:
                     _LOGGER.debug("Packet sent successfully")
                     return True
                 else:
-                    _LOGGER.warning(f"Send failed on attempt {retries + 1}")
+                    _LOGGER.warning("Send failed on attempt %s", retries + 1)
                     
             except Exception as e:
-                _LOGGER.error(f"Send error on attempt {retries + 1}: {e}")
+                _LOGGER.error("Send error on attempt %s: %s", retries + 1, e)
             
             retries += 1
+            # 연결이 끊긴 경우 대기 없이 바로 실패 처리
+            if not self.connection.connected:
+                _LOGGER.warning("Connection lost after attempt %s", retries)
+                return False
             if retries < self.max_retries:
-                await asyncio.sleep(self.timeout * retries)  # ������ �����
+                await asyncio.sleep(min(self.timeout * retries, _MAX_RETRY_DELAY))  # ������ �����
         
-        _LOGGER.error(f"Failed to send packet after {self.max_retries} attempts: {packet.hex()}")
+        _LOGGER.error("Failed to send packet after %s attempts: %s", self.max_retries, packet.hex())
         return False
 
     async def send_packet(self, packet: bytearray) -> bool:
@@ -392,28 +507,30 @@ class KocomClient:
                 return False
             
             # ?? ����: ��Ŷ ��� �߰�
-            packet_copy = bytearray(packet)  # ���� ���� ����
-            packet_copy[:0] = PREFIX_HEADER
+            # 클라이언트 전용 스크래치 버퍼에 슬라이스 대입으로 프레임을 조립
+            # (길이를 바꾸지 않으므로 재할당 없음, 큐에는 불변 bytes만 전달)
+            body_end = _PREFIX_LEN + len(packet)
+            frame_len = body_end + 1 + _SUFFIX_LEN
+            frame = self._tx_scratch
+            if len(frame) < frame_len:
+                frame = self._tx_scratch = bytearray(frame_len)
+            frame[:_PREFIX_LEN] = PREFIX_HEADER
+            frame[_PREFIX_LEN:body_end] = packet
+            view = memoryview(frame)
             
             # ?? ����: üũ�� ��� ����
-            checksum = calculate_checksum(packet_copy)
+            checksum = calculate_checksum(view[:body_end])
             if checksum is None:
-                _LOGGER.error(f"Checksum calculation failed: {packet_copy.hex()}")
+                _LOGGER.error("Checksum calculation failed: %s", view[:body_end].hex())
                 return False
             
-            packet_copy.append(checksum)
-            packet_copy.extend(SUFFIX_HEADER)
+            frame[body_end] = checksum
+            frame[body_end + 1:frame_len] = SUFFIX_HEADER
             
-            # ?? ����: ���� üũ�� ����
-            if not verify_checksum(packet_copy):
-                _LOGGER.error(f"Final checksum verification failed: {packet_copy.hex()}")
-                return False
-            
-            await self.packet_queue.add_packet(bytes(packet_copy))
-            return True
+            return self.packet_queue.add_packet(bytes(view[:frame_len]))
             
         except Exception as e:
-            _LOGGER.error(f"Error preparing packet for send: {e}")
+            _LOGGER.error("Error preparing packet for send: %s", e)
             return False
 
     # ?? ����: ���� ��ȸ �޼����
@@ -425,10 +542,10 @@ class KocomClient:
         """Get client statistics."""
         return {
             "is_running": self._is_running,
-            "active_callbacks": len([cb for cb in self.device_callbacks if cb is not None]),
+            "active_callbacks": len(self.device_callbacks),
             "queue_size": self.packet_queue.size(),
             "queue_empty": self.packet_queue.is_empty(),
-            "connection_status": self.connection.is_connected() if self.connection else False,
+            "connection_status": self.connection.connected if self.connection else False,
             "active_tasks": len([t for t in self.tasks if t and not t.done()]),
         }
 
@@ -443,16 +560,7 @@ class KocomClient:
 
     async def clear_queue(self) -> int:
         """Clear all pending packets and return count cleared."""
-        cleared_count = 0
-        try:
-            while not self.packet_queue.is_empty():
-                if await self.packet_queue.get_packet() is not None:
-                    cleared_count += 1
-                else:
-                    break
-            _LOGGER.info(f"Cleared {cleared_count} packets from queue")
-            return cleared_count
-        except Exception as e:
-            _LOGGER.error(f"Error clearing queue: {e}")
-            return cleared_count
+        cleared_count = self.packet_queue.clear()
+        _LOGGER.info("Cleared %s packets from queue", cleared_count)
+        return cleared_count
                     
\ No newline at end of file
@@ -6,6 +6,8 @@ _LOGGER = logging.getLogger(__package__)
 
 PREFIX_HEADER = b"\xaaU"
 SUFFIX_HEADER = b"\r\r"
+# header(2) + body(16) + checksum(1) + suffix(2)
+MIN_PACKET_LEN = 21
 
 POWER = "power"
 BRIGHTNESS = "brightness"
@@ -1,19 +1,11 @@
 """CRC calculation for py wallpad."""
 
+from binascii import crc_hqx
+
 def crc_ccitt_xmodem(data: bytes) -> int:
     """Calculate CRC-CCITT (XMODEM) checksum."""
-    crc = 0x0000
-    polynomial = 0x1021
-
-    for byte in data:
-        crc ^= (byte << 8)
-        for _ in range(8):
-            if crc & 0x8000:
-                crc = (crc << 1) ^ polynomial
-            else:
-                crc = crc << 1
-            crc &= 0xFFFF  # Keep CRC 16-bit
-    return crc
+    # binascii.crc_hqx는 동일한 CRC-CCITT(0x1021, 초기값 0)를 C로 계산
+    return crc_hqx(data, 0)
 
 def verify_crc(packet: bytes) -> bool:
     """Verify CRC for a packet."""
@@ -37,22 +29,19 @@ def calculate_crc(packet: bytes) -> list[int, int] | None:
     # Append the 16-bit checksum (split into two bytes)
     checksum_high = (checksum >> 8) & 0xFF
     checksum_low = checksum & 0xFF
-    return list(checksum_high, checksum_low)
+    return [checksum_high, checksum_low]
 
 def verify_checksum(packet: bytes) -> bool:
     """Verify checksum for a packet."""
     if len(packet) < 21:
         return False
     
-    data_sum = sum(packet[:18])
-    calculated_checksum = (data_sum + 1) % 256
-    return calculated_checksum == packet[18]
+    # sum()은 C 수준 루프이므로 별도 가속 없이 한 번의 합산으로 검증
+    return (sum(packet[:18]) + 1) & 0xFF == packet[18]
 
 def calculate_checksum(packet: bytes) -> int | None:
     """Calculate checksum for a packet."""
     if len(packet) < 17:
         return None
     
-    data_sum = sum(packet)
-    checksum = (data_sum + 1) % 256
-    return checksum
+    return (sum(packet) + 1) & 0xFF
@@ -67,6 +67,8 @@ class Device:
 class KocomPacket:
     """Base class for Kocom packets."""
 
+    _TYPE_ID: ClassVar[int] = 0  # 패킷 클래스별 고유 번호 (플랫폼 조회 테이블 인덱스)
+
     def __init__(self, packet: bytes) -> None:
         """Initialize the packet."""
         self.packet = packet
@@ -77,7 +79,7 @@ class KocomPacket:
         self.command = Command(packet[9])
         self.value = packet[10:18]
         self.checksum = packet[18]
-        self._last_recv_time = time.time()
+        self._last_recv_time = time.monotonic()  # 경과 시간용 (시스템 시계 변경 영향 없음)
         self._device: Device = None
         self._last_data: dict[str, Any] = {}
 
@@ -129,6 +131,7 @@ class KocomPacket:
 class LightPacket(KocomPacket):
     """Handles packets for light devices."""
 
+    _TYPE_ID: ClassVar[int] = 1
     _class_last_data: ClassVar[dict[str, dict[str, Any]]] = {}
 
     def __init__(self, packet: bytes) -> None:
@@ -209,6 +212,7 @@ class LightPacket(KocomPacket):
 class OutletPacket(KocomPacket):
     """Handles packets for outlet devices."""
 
+    _TYPE_ID: ClassVar[int] = 2
     _class_last_data: ClassVar[dict[str, dict[str, Any]]] = {}
 
     def __init__(self, packet: bytes) -> None:
@@ -262,6 +266,7 @@ class OutletPacket(KocomPacket):
 class ThermostatPacket(KocomPacket):
     """Handles packets for thermostat devices."""
 
+    _TYPE_ID: ClassVar[int] = 3
     _class_last_data: ClassVar[dict[str, dict[str, Any]]] = {}
 
     def __init__(self, packet: bytes) -> None:
@@ -289,11 +294,11 @@ class ThermostatPacket(KocomPacket):
         boiler_error = self.value[7]
         
         if hotwater_state and not self._last_data[self.device_id][HOTWATER_STATE]:
-            _LOGGER.debug(f"Hotwater state changed to {hotwater_state}.")
+            _LOGGER.debug("Hotwater state changed to %s.", hotwater_state)
             self._last_data[self.device_id][HOTWATER_STATE] = True
 
         if power_state and self._last_data[self.device_id][TARGET_TEMP] != target_temp:
-            _LOGGER.debug(f"Target temp changed to {target_temp}.")
+            _LOGGER.debug("Target temp changed to %s.", target_temp)
             self._last_data[self.device_id][TARGET_TEMP] = target_temp
 
         devices.append(
@@ -330,7 +335,7 @@ class ThermostatPacket(KocomPacket):
 
         if self._last_data[self.device_id][HOTWATER_STATE] and self.room_id == '0':
             if hotwater_temp > 0:
-                _LOGGER.debug(f"Supports hot water temperature in thermostat.")
+                _LOGGER.debug("Supports hot water temperature in thermostat.")
                 devices.append(
                     Device(
                         device_type=self.device_name(),
@@ -341,7 +346,7 @@ class ThermostatPacket(KocomPacket):
                     )
                 )
             if heatwater_temp > 0:
-                _LOGGER.debug(f"Supports heat water temperature in thermostat.")
+                _LOGGER.debug("Supports heat water temperature in thermostat.")
                 devices.append(
                     Device(
                         device_type=self.device_name(),
@@ -382,6 +387,8 @@ class ThermostatPacket(KocomPacket):
 class ACPacket(KocomPacket):
     """Handles packets for AC devices."""
 
+    _TYPE_ID: ClassVar[int] = 4
+
     def parse_data(self) -> list[Device]:
         """Parse AC-specific data."""
         power_state = self.value[0] == 0x10
@@ -437,6 +444,7 @@ class ACPacket(KocomPacket):
 class FanPacket(KocomPacket):
     """Handles packets for fan devices."""
     
+    _TYPE_ID: ClassVar[int] = 5
     _class_last_data: ClassVar[dict[str, dict[str, Any]]] = {}
 
     def __init__(self, packet: bytes) -> None:
@@ -463,7 +471,7 @@ class FanPacket(KocomPacket):
         speed_list = list(FanSpeed.__members__.keys())
 
         if co2 and not self._last_data[self.device_id][CO2]:
-            _LOGGER.debug(f"CO2 detected: {co2_state}")
+            _LOGGER.debug("CO2 detected: %s", co2_state)
             self._last_data[self.device_id][CO2] = True
 
         devices.append(
@@ -530,6 +538,8 @@ class FanPacket(KocomPacket):
 class IAQPacket(KocomPacket):
     """Handles packets for IAQ devices."""
 
+    _TYPE_ID: ClassVar[int] = 6
+
     def parse_data(self) -> list[Device]:
         """Parse IAQ-specific data."""
         devices: list[Device] = []
@@ -545,7 +555,7 @@ class IAQPacket(KocomPacket):
 
         for sensor_id, state in sensor_mapping.items():
             if state > 0:
-                _LOGGER.debug(f"{sensor_id}: {state}")
+                _LOGGER.debug("%s: %s", sensor_id, state)
                 device = Device(
                     device_type=self.device_name(upper=True),
                     device_id=self.device_id,
@@ -563,6 +573,8 @@ class IAQPacket(KocomPacket):
 
 class GasPacket(KocomPacket):
     """Handles packets for gas devices."""
+
+    _TYPE_ID: ClassVar[int] = 7
     
     def parse_data(self) -> list[Device]:
         """Parse gas-specific data."""
@@ -581,7 +593,7 @@ class GasPacket(KocomPacket):
     def make_power_status(self, power: bool) -> bytearray:
         """Make a power status packet."""
         if power:
-            _LOGGER.debug(f"Gas device is on. Ignoring power status.")
+            _LOGGER.debug("Gas device is on. Ignoring power status.")
             return
         return super().make_packet(Command.OFF, bytearray(self.value))
     
@@ -589,6 +601,8 @@ class GasPacket(KocomPacket):
 class MotionPacket(KocomPacket):
     """Handles packets for motion devices."""
 
+    _TYPE_ID: ClassVar[int] = 8
+
     def parse_data(self) -> list[Device]:
         """Parse motion-specific data."""
         device = Device(
@@ -603,6 +617,7 @@ class MotionPacket(KocomPacket):
 class EVPacket(KocomPacket):
     """Handles packets for EV devices."""
 
+    _TYPE_ID: ClassVar[int] = 9
     _class_last_data: ClassVar[dict[str, dict[str, Any]]] = {}
 
     def __init__(self, packet: bytes) -> None:
@@ -644,7 +659,7 @@ class EVPacket(KocomPacket):
         )
 
         if (isinstance(floor_state, int) and (floor_state > 0)) or self._last_data[self.device_id][FLOOR]:
-            _LOGGER.debug(f"Support EV floor: {floor_state}")
+            _LOGGER.debug("Support EV floor: %s", floor_state)
             self._last_data[self.device_id][FLOOR] = True
             
             devices.append(
@@ -662,13 +677,31 @@ class EVPacket(KocomPacket):
     def make_power_status(self, power: bool) -> bytearray:
         """Make a power status packet."""
         if not power:
-            _LOGGER.debug(f"EV device is off. Ignoring power status.")
+            _LOGGER.debug("EV device is off. Ignoring power status.")
             return
         return super().make_packet(Command.ON, bytearray(self.value))
 
 
+_DEVICE_CLASS_MAP: dict[int, type[KocomPacket]] = {
+    DeviceType.LIGHT.value: LightPacket,
+    DeviceType.OUTLET.value: OutletPacket,
+    DeviceType.THERMOSTAT.value: ThermostatPacket,
+    DeviceType.AC.value: ACPacket,
+    DeviceType.FAN.value: FanPacket,
+    DeviceType.IAQ.value: IAQPacket,
+    DeviceType.GAS.value: GasPacket,
+    DeviceType.MOTION.value: MotionPacket,
+    DeviceType.EV.value: EVPacket,
+    DeviceType.WALLPAD.value: KocomPacket,
+}
+
+
 class PacketParser:
-    """Parses raw Kocom packets into specific device classes."""
+    """Parses raw Kocom packets into specific device classes.
+
+    parse_state is not memoized: parse_data learns per-device history into
+    the class-level _last_data, and callers mutate the returned packets.
+    """
 
     @staticmethod
     def parse(packet_data: bytes) -> KocomPacket:
@@ -703,29 +736,16 @@ class PacketParser:
     @staticmethod
     def _get_packet_instance(device_type: int, packet_data: bytes) -> KocomPacket:
         """Retrieve the appropriate packet class based on device type."""
-        device_class_map = {
-            DeviceType.LIGHT.value: LightPacket,
-            DeviceType.OUTLET.value: OutletPacket,
-            DeviceType.THERMOSTAT.value: ThermostatPacket,
-            DeviceType.AC.value: ACPacket,
-            DeviceType.FAN.value: FanPacket,
-            DeviceType.IAQ.value: IAQPacket,
-            DeviceType.GAS.value: GasPacket,
-            DeviceType.MOTION.value: MotionPacket,
-            DeviceType.EV.value: EVPacket,
-            DeviceType.WALLPAD.value: KocomPacket,
-        }
-
-        packet_class = device_class_map.get(device_type)
+        packet_class = _DEVICE_CLASS_MAP.get(device_type)
         if packet_class is None:
-            _LOGGER.error(f"Unknown device type: {hex(device_type)}, data: {packet_data.hex()}")
+            _LOGGER.error("Unknown device type: %s, data: %s", hex(device_type), packet_data.hex())
             return KocomPacket(packet_data)
         
         if packet_data[5] == DeviceType.EV.value and packet_class == KocomPacket:
             packet_data = bytearray(packet_data)
             packet_data[5] = 0x01
             packet_data[7] = 0x44
-            _LOGGER.debug(f"EV device detected from wallpad: {packet_data.hex()}")
+            _LOGGER.debug("EV device detected from wallpad: %s", packet_data.hex())
             return EVPacket(bytes(packet_data))
         
         return packet_class(packet_data)
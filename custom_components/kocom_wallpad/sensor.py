@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from homeassistant.components.sensor import (
     SensorEntity,
     SensorDeviceClass,
@@ -53,13 +55,17 @@ async def async_setup_entry(
     gateway: KocomGateway = hass.data[DOMAIN][entry.entry_id]
     
     @callback
-    def async_add_sensor(packet: KocomPacket) -> None:
-        """Add new sensor entity."""
-        if isinstance(packet, (FanPacket, IAQPacket, EVPacket)):
-            async_add_entities([KocomSensorEntity(gateway, packet)])
+    def async_add_sensor(packets: Iterable[KocomPacket]) -> None:
+        """Add new sensor entities."""
+        async_add_entities(
+            [
+                KocomSensorEntity(gateway, packet)
+                for packet in packets
+                if isinstance(packet, (FanPacket, IAQPacket, EVPacket))
+            ]
+        )
     
-    for entity in gateway.get_entities(Platform.SENSOR):
-        async_add_sensor(entity)
+    async_add_sensor(gateway.get_entities(Platform.SENSOR))
         
     entry.async_on_unload(
         async_dispatcher_connect(hass, f"{DOMAIN}_sensor_add", async_add_sensor)
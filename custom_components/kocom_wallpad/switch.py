@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchDeviceClass
@@ -35,13 +36,17 @@ async def async_setup_entry(
     gateway: KocomGateway = hass.data[DOMAIN][entry.entry_id]
     
     @callback
-    def async_add_switch(packet: KocomPacket) -> None:
-        """Add new switch entity."""
-        if isinstance(packet, (OutletPacket, GasPacket, EVPacket)):
-            async_add_entities([KocomSwitchEntity(gateway, packet)])
+    def async_add_switch(packets: Iterable[KocomPacket]) -> None:
+        """Add new switch entities."""
+        async_add_entities(
+            [
+                KocomSwitchEntity(gateway, packet)
+                for packet in packets
+                if isinstance(packet, (OutletPacket, GasPacket, EVPacket))
+            ]
+        )
     
-    for entity in gateway.get_entities(Platform.SWITCH):
-        async_add_switch(entity)
+    async_add_switch(gateway.get_entities(Platform.SWITCH))
         
     entry.async_on_unload(
         async_dispatcher_connect(hass, f"{DOMAIN}_switch_add", async_add_switch)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import base64
+import binascii
 import json
 
 def process_string(s: str) -> str:
@@ -23,4 +24,5 @@ def encode_bytes_to_base64(data: bytes) -> str:
 
 def decode_base64_to_bytes(data: str) -> bytes:
     """Decode Base64 string to bytes."""
-    return base64.b64decode(data)
+    # Decoded bytes are kept by the parsed packet, so no shared buffer is reused.
+    return binascii.a2b_base64(data)